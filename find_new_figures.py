@@ -1,8 +1,16 @@
-import re
 import os
-import shutil
+import sys
+import mmap
+import asyncio
+import bisect
+import hashlib
+import functools
+from itertools import chain
+import stat
+from array import array
 from pathlib import Path
-from typing import Set, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import FrozenSet, Iterable, Iterator, Set, List, Tuple, Optional
 import logging
 from dataclasses import dataclass
 
@@ -10,6 +18,190 @@ from dataclasses import dataclass
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Tokens for the includegraphics scanner
+_INCLUDEGRAPHICS = b'\\includegraphics'
+_WHITESPACE = b' \t\n\r\f\v'
+
+# Chunk sizes for the kernel-side copy calls and the userspace fallback loop
+_KERNEL_COPY_CHUNK = 1 << 30
+_COPY_BUFSIZE = 1 << 20
+
+def _skip_whitespace(buf, pos: int, end: int) -> int:
+    """Return the first index at or after pos that is not ASCII whitespace."""
+    while pos < end and buf[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+def _iter_includegraphics(buf) -> Iterator[bytes]:
+    r"""
+    Yield the raw path argument of every includegraphics command in a buffer.
+    
+    Accepts the same syntax as \includegraphics[options]{path} with optional
+    whitespace, but is driven by bytes.find instead of a backtracking regex.
+    The next ']' and '}' positions are remembered between commands together
+    with where their search started; a cached position is reused only if that
+    search covered everything after the current command, so unbalanced option
+    brackets do not cause repeated rescans of the rest of the document.
+    
+    Args:
+        buf: bytes-like object supporting find() and indexing (e.g. an mmap)
+    
+    Examples:
+        >>> list(_iter_includegraphics(b'\\includegraphics[w=1]{a.png}'))
+        [b'a.png']
+        >>> list(_iter_includegraphics(b'\\includegraphics[\\includegraphics{a.png}]{}x}'))
+        [b'a.png']
+        >>> list(_iter_includegraphics(b'\\includegraphics[\\includegraphics{a.png}]{b'))
+        [b'a.png']
+    """
+    find = buf.find
+    end = len(buf)
+    key_len = len(_INCLUDEGRAPHICS)
+    # Cached search results (-1: none left) and the index each search began
+    # at; an origin past the end forces the first search
+    next_bracket = next_brace = -1
+    bracket_from = brace_from = end + 1
+    pos = 0
+    
+    while True:
+        pos = find(_INCLUDEGRAPHICS, pos)
+        if pos == -1:
+            return
+        pos += key_len
+        
+        start = _skip_whitespace(buf, pos, end)
+        if start < end and buf[start] == ord('['):
+            # Skip the optional argument
+            if bracket_from > start + 1 or (next_bracket != -1 and next_bracket <= start):
+                bracket_from = start + 1
+                next_bracket = find(b']', bracket_from)
+            if next_bracket == -1:
+                continue
+            start = _skip_whitespace(buf, next_bracket + 1, end)
+        
+        if start >= end or buf[start] != ord('{'):
+            continue
+        
+        if brace_from > start + 1 or (next_brace != -1 and next_brace <= start):
+            brace_from = start + 1
+            next_brace = find(b'}', brace_from)
+        if next_brace <= start + 1:
+            continue  # Unterminated or empty path argument
+        
+        yield buf[start + 1:next_brace]
+        pos = next_brace + 1
+
+def _snapshot_names(directory: Path, limit: int) -> Optional[FrozenSet[str]]:
+    """
+    List the entry names of a directory if it holds at most limit entries.
+    
+    Args:
+        directory: Directory to list
+        limit: Largest directory size worth snapshotting
+        
+    Returns:
+        Frozen set of entry names (empty if the directory doesn't exist), or
+        None when names should be probed one by one instead: the directory is
+        larger than limit or was modified while it was being listed
+    """
+    names = set()
+    try:
+        mtime_before = os.stat(directory).st_mtime_ns
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if len(names) >= limit:
+                    return None
+                names.add(entry.name)
+        if os.stat(directory).st_mtime_ns != mtime_before:
+            return None
+    except FileNotFoundError:
+        pass
+    return frozenset(names)
+
+def _fastcopy(src: str, dst: str) -> None:
+    """
+    Copy a file's data, permission bits and timestamps (like shutil.copy2).
+    
+    Tries os.copy_file_range first (server-side or reflink copies on NFS,
+    btrfs and XFS), then os.sendfile, and finishes whatever is left with a
+    1 MB readinto loop.
+    
+    Args:
+        src: Source file path
+        dst: Destination file path
+        
+    Raises:
+        FileExistsError: If dst already exists (it is never overwritten)
+    """
+    with open(src, 'rb', buffering=0) as fsrc, open(dst, 'xb', buffering=0) as fdst:
+        infd = fsrc.fileno()
+        outfd = fdst.fileno()
+        st = os.fstat(infd)
+        offset = 0
+        
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while offset < st.st_size:
+                    sent = os.copy_file_range(infd, outfd, _KERNEL_COPY_CHUNK)
+                    if not sent:
+                        break
+                    offset += sent
+            except OSError:
+                pass  # Unsupported for this pair of files, try the next method
+        
+        if offset < st.st_size and hasattr(os, 'sendfile'):
+            try:
+                while offset < st.st_size:
+                    sent = os.sendfile(outfd, infd, offset, _KERNEL_COPY_CHUNK)
+                    if not sent:
+                        break
+                    offset += sent
+            except OSError:
+                pass  # e.g. macOS only sends to sockets
+        
+        # Copy the remainder (or everything) in userspace
+        os.lseek(infd, offset, os.SEEK_SET)
+        os.lseek(outfd, offset, os.SEEK_SET)
+        buf = bytearray(_COPY_BUFSIZE)
+        view = memoryview(buf)
+        while True:
+            size = fsrc.readinto(buf)
+            if not size:
+                break
+            pending = view[:size]
+            while pending:
+                pending = pending[fdst.write(pending):]
+    
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+def _copy_in_threads(tasks: List[Tuple[str, str, str]]
+                     ) -> Iterator[Tuple[Tuple[str, str, str], Optional[BaseException]]]:
+    """
+    Copy (image, source, destination) tasks on a thread pool.
+    
+    Copies are independent and IO-bound, so they overlap well on threads.
+    Yields (task, error) pairs as copies finish; error is None on success.
+    """
+    if not tasks:
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(32, len(tasks))) as executor:
+        futures = {executor.submit(_fastcopy, task[1], task[2]): task for task in tasks}
+        for future in as_completed(futures):
+            yield futures[future], future.exception()
+
+async def _acopy_many(tasks: List[Tuple[str, str, str]]) -> List[Optional[BaseException]]:
+    """
+    Copy (image, source, destination) tasks concurrently from an event loop.
+    
+    Returns one entry per task, in order: None on success, else the exception.
+    """
+    return await asyncio.gather(
+        *(asyncio.to_thread(_fastcopy, src_file, dst_file) for _, src_file, dst_file in tasks),
+        return_exceptions=True
+    )
+
 @dataclass
 class ComparisonResult:
     """Data class to store comparison results"""
@@ -17,16 +209,57 @@ class ComparisonResult:
     new_images: Set[str]
     added_images: Set[str]
     removed_images: Set[str]
-    common_images: Set[str]
+    common_images: Set[str]  # Left empty when common_keys is used instead
+    common_keys: Optional[array] = None  # Sorted 64-bit name keys, opt-in
+    
+    @property
+    def common_count(self) -> int:
+        """Number of images common to both files, in whichever form they are kept."""
+        if self.common_keys is None:
+            return len(self.common_images)
+        return len(self.common_keys)
+    
+    @functools.cached_property
+    def added_sorted(self) -> Tuple[str, ...]:
+        """Added images in display order, sorted once on first access."""
+        return tuple(sorted(self.added_images))
+    
+    @functools.cached_property
+    def removed_sorted(self) -> Tuple[str, ...]:
+        """Removed images in display order, sorted once on first access."""
+        return tuple(sorted(self.removed_images))
 
 @dataclass
 class CopyResult:
-    """Data class to store copy operation results"""
+    """Data class to store copy operation results (lists are kept sorted)"""
     copied: List[str]
     missing: List[str]
     failed: List[str]
     total_attempted: int
 
+def _name_key(name: str) -> int:
+    """Return a stable 64-bit key for an image filename (same in every process)."""
+    return int.from_bytes(hashlib.blake2b(name.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def membership_sorted(result: ComparisonResult, name: str) -> bool:
+    """
+    Test whether an image is common to both documents using the compact keys.
+    
+    Args:
+        result: ComparisonResult created with compact_common=True
+        name: Image filename to look up
+        
+    Returns:
+        True if the image is (with overwhelming probability) a common image
+    """
+    if result.common_keys is None:
+        return name in result.common_images
+    
+    keys = result.common_keys
+    key = _name_key(name)
+    index = bisect.bisect_left(keys, key)
+    return index < len(keys) and keys[index] == key
+
 class LaTeXImageExtractor:
     """
     A utility class for extracting and comparing images referenced in LaTeX documents.
@@ -43,71 +276,131 @@ class LaTeXImageExtractor:
             image_extensions: List of image file extensions to consider
         """
         self.image_extensions = image_extensions or self.DEFAULT_IMAGE_EXTENSIONS
-        self.includegraphics_pattern = re.compile(
-            r'\\includegraphics(?:\s*\[[^\]]*\])?\s*\{([^}]+)\}',
-            re.MULTILINE
-        )
+        self._ext_suffixes = tuple(ext.encode('utf-8') for ext in self.image_extensions)
+        
+        # Extracted image sets keyed by (path, mtime_ns, size); a changed file
+        # gets a new key, so stale entries simply age out
+        self._extract_cached = functools.lru_cache(maxsize=64)(self._extract_uncached)
         
         logger.info(f"Initialized extractor with extensions: {self.image_extensions}")
     
-    def extract_images_from_tex(self, tex_file: str) -> Set[str]:
+    def _iter_image_candidates(self, tex_file: str) -> Iterator[List[bytes]]:
         """
-        Extract all image files referenced in a LaTeX document.
+        Yield the candidate image filenames for every distinct image reference.
+        
+        A reference with an extension yields a single filename; an extensionless
+        one yields one candidate per configured extension. The same name may be
+        produced by several references (e.g. different directories). Names are
+        returned as undecoded bytes.
         
         Args:
             tex_file: Path to the LaTeX file
             
-        Returns:
-            Set of image filenames found in the document
-            
         Raises:
-            FileNotFoundError: If the LaTeX file doesn't exist
             IOError: If there's an error reading the file
         """
-        tex_path = Path(tex_file)
-        
-        if not tex_path.exists():
-            raise FileNotFoundError(f"LaTeX file not found: {tex_file}")
-        
         try:
-            with open(tex_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Scan the memory-mapped bytes directly and collapse repeated
+            # references before anything is decoded
+            with open(tex_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    references = set()
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        references = set(_iter_includegraphics(mm))
         except Exception as e:
             raise IOError(f"Error reading LaTeX file {tex_file}: {e}")
         
-        # Find all includegraphics commands
-        matches = self.includegraphics_pattern.findall(content)
-        
-        image_files = set()
+        basename = os.path.basename
+        splitext = os.path.splitext
+        suffixes = self._ext_suffixes
         
-        for match in matches:
-            # Clean the path (remove leading/trailing whitespace)
-            image_path = match.strip()
-            
-            # Extract just the filename
-            filename = os.path.basename(image_path)
+        for raw in references:
+            # Clean the path and extract just the filename
+            filename = basename(raw.strip())
             
             # Split filename and extension
-            name, ext = os.path.splitext(filename)
+            name, ext = splitext(filename)
             
             if ext:
-                # File has extension, add it directly
-                image_files.add(filename)
+                # File has extension, use it directly
+                yield [filename]
             else:
                 # File has no extension, try all possible extensions
-                for extension in self.image_extensions:
-                    image_files.add(name + extension)
+                yield [name + suffix for suffix in suffixes]
+    
+    def _extract_uncached(self, path: str, mtime_ns: int, size: int) -> FrozenSet[str]:
+        """
+        Scan a LaTeX file for image references (wrapped by the LRU cache).
+        
+        Args:
+            path: Path to the LaTeX file
+            mtime_ns: Modification time of the file, only used as cache key
+            size: Size of the file, only used as cache key
+            
+        Returns:
+            Frozen set of image filenames found in the document
+        """
+        # Stream the candidates straight into one set, no per-reference loop
+        image_files = set(chain.from_iterable(self._iter_image_candidates(path)))
+        
+        # Decode only the final, distinct filenames
+        return frozenset(name.decode('utf-8', 'replace') for name in image_files)
+    
+    def _load_images(self, tex_file: str) -> FrozenSet[str]:
+        """
+        Return the image filenames of a LaTeX file, rescanning only if it changed.
+        
+        Args:
+            tex_file: Path to the LaTeX file
+            
+        Returns:
+            Frozen set of image filenames found in the document
+            
+        Raises:
+            FileNotFoundError: If the LaTeX file doesn't exist
+            IOError: If there's an error reading the file
+        """
+        tex_path = Path(tex_file)
+        
+        try:
+            st = tex_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"LaTeX file not found: {tex_file}")
+        
+        return self._extract_cached(str(tex_path), st.st_mtime_ns, st.st_size)
+    
+    def extract_images_from_tex(self, tex_file: str) -> Set[str]:
+        """
+        Extract all image files referenced in a LaTeX document.
+        
+        Args:
+            tex_file: Path to the LaTeX file
+            
+        Returns:
+            Set of image filenames found in the document
+            
+        Raises:
+            FileNotFoundError: If the LaTeX file doesn't exist
+            IOError: If there's an error reading the file
+        """
+        image_files = set(self._load_images(tex_file))
         
         logger.info(f"Extracted {len(image_files)} image references from {tex_file}")
         return image_files
     
-    def compare_tex_files(self, old_tex: str, new_tex: str) -> ComparisonResult:
+    def compare_tex_files(self, old_tex: str, new_tex: str,
+                          compact_common: bool = False) -> ComparisonResult:
         """
         Compare image references between two LaTeX files.
         
         Args:
             old_tex: Path to the old LaTeX file
             new_tex: Path to the new LaTeX file
+            compact_common: Keep the common images only as a sorted array of
+                64-bit keys (8 bytes each) instead of a set of names;
+                common_images is then left empty and membership_sorted()
+                is the lookup path
             
         Returns:
             ComparisonResult object with comparison details
@@ -117,20 +410,33 @@ class LaTeXImageExtractor:
         old_images = self.extract_images_from_tex(old_tex)
         new_images = self.extract_images_from_tex(new_tex)
         
-        added_images = new_images - old_images
-        removed_images = old_images - new_images
-        common_images = old_images & new_images
+        # Partition the new images in one pass, probing the old set only once each
+        added_images = set()
+        common_images = set()
+        for name in new_images:
+            (common_images if name in old_images else added_images).add(name)
+        removed_images = old_images - common_images
+        
+        common_count = len(common_images)
+        if compact_common:
+            # Drop the name set so the result really is smaller (and cheaper
+            # to pickle back from worker processes)
+            common_keys = array('Q', sorted(_name_key(name) for name in common_images))
+            common_images = set()
+        else:
+            common_keys = None
         
         result = ComparisonResult(
             old_images=old_images,
             new_images=new_images,
             added_images=added_images,
             removed_images=removed_images,
-            common_images=common_images
+            common_images=common_images,
+            common_keys=common_keys
         )
         
         logger.info(f"Comparison complete: {len(added_images)} added, "
-                   f"{len(removed_images)} removed, {len(common_images)} common")
+                   f"{len(removed_images)} removed, {common_count} common")
         
         return result
     
@@ -144,29 +450,34 @@ class LaTeXImageExtractor:
             old_file: Name of the old file for display
             new_file: Name of the new file for display
         """
-        print(f"\n📊 **Image Comparison Summary**")
-        print(f"   Old file ({old_file}): {len(result.old_images)} images")
-        print(f"   New file ({new_file}): {len(result.new_images)} images")
-        print(f"   Common images: {len(result.common_images)}")
-        print(f"   Added images: {len(result.added_images)}")
-        print(f"   Removed images: {len(result.removed_images)}")
+        # Build the whole report and emit it with a single write
+        out = [
+            f"\n📊 **Image Comparison Summary**",
+            f"   Old file ({old_file}): {len(result.old_images)} images",
+            f"   New file ({new_file}): {len(result.new_images)} images",
+            f"   Common images: {result.common_count}",
+            f"   Added images: {len(result.added_images)}",
+            f"   Removed images: {len(result.removed_images)}",
+        ]
         
         if result.added_images:
-            print(f"\n✅ **Images added in {new_file}:**")
-            for img in sorted(result.added_images):
-                print(f"   + {img}")
+            out.append(f"\n✅ **Images added in {new_file}:**")
+            out.extend(f"   + {img}" for img in result.added_sorted)
         else:
-            print(f"\n✅ No new images were added in {new_file}")
+            out.append(f"\n✅ No new images were added in {new_file}")
         
         if result.removed_images:
-            print(f"\n❌ **Images removed from {new_file}:**")
-            for img in sorted(result.removed_images):
-                print(f"   - {img}")
+            out.append(f"\n❌ **Images removed from {new_file}:**")
+            out.extend(f"   - {img}" for img in result.removed_sorted)
+        
+        sys.stdout.write('\n'.join(out) + '\n')
     
-    def copy_images(self, image_list: Set[str], source_dir: str, 
-                   destination_dir: str, create_dest: bool = True) -> CopyResult:
+    def _plan_copies(self, image_list: Set[str], source_dir: str,
+                     destination_dir: str, create_dest: bool) -> List[Tuple[str, str, str]]:
         """
-        Copy a list of images from source to destination directory.
+        Prepare the destination and work out which images need copying.
+        
+        Images already present in the destination are logged and skipped.
         
         Args:
             image_list: Set of image filenames to copy
@@ -175,7 +486,7 @@ class LaTeXImageExtractor:
             create_dest: Whether to create destination directory if it doesn't exist
             
         Returns:
-            CopyResult object with operation details
+            List of (image, source file, destination file) tuples
         """
         source_path = Path(source_dir)
         dest_path = Path(destination_dir)
@@ -187,37 +498,88 @@ class LaTeXImageExtractor:
             dest_path.mkdir(parents=True, exist_ok=True)
             logger.info(f"Ensured destination directory exists: {destination_dir}")
         
-        copied = []
-        missing = []
-        failed = []
+        # Snapshot the destination once instead of stat-ing every file, unless
+        # it is much larger than the image list; missing sources are detected
+        # by the copy itself failing to open them
+        dst_names = _snapshot_names(dest_path, limit=4 * len(image_list))
         
+        log_info = logger.isEnabledFor(logging.INFO)
+        
+        # Join plain strings in the loop rather than building Path objects
+        src_root = os.fspath(source_path)
+        dst_root = os.fspath(dest_path)
+        join = os.path.join
+        sep, altsep = os.sep, os.altsep
+        
+        tasks = []
         for image in image_list:
-            src_file = source_path / image
-            dst_file = dest_path / image
+            src_file = join(src_root, image)
+            dst_file = join(dst_root, image)
             
-            try:
-                if src_file.exists():
-                    # Check if destination already exists
-                    if dst_file.exists():
-                        logger.info(f"Skipped (already exists): {image}")
-                        continue
-                    
-                    shutil.copy2(src_file, dst_file)
-                    copied.append(image)
-                    logger.info(f"Copied: {image}")
-                else:
-                    missing.append(image)
-                    logger.warning(f"Source file not found: {src_file}")
+            # Check if destination already exists; the snapshot only holds
+            # top-level names, so paths with a directory part are probed
+            if dst_names is None or sep in image or (altsep and altsep in image):
+                exists = os.path.lexists(dst_file)
+            else:
+                exists = image in dst_names
+            if exists:
+                if log_info:
+                    logger.info("Skipped (already exists): %s", image)
+                continue
             
-            except Exception as e:
+            tasks.append((image, src_file, dst_file))
+        
+        return tasks
+    
+    def _collect_copies(self, outcomes: Iterable[Tuple[Tuple[str, str, str], Optional[BaseException]]],
+                        total_attempted: int) -> CopyResult:
+        """
+        Classify finished copies into copied, missing and failed images.
+        
+        A destination that appeared after it was checked makes the copy fail
+        with FileExistsError; such images are skipped like existing ones.
+        
+        Args:
+            outcomes: (task, error) pairs, where error is None for a successful copy
+            total_attempted: Number of images originally requested
+            
+        Returns:
+            CopyResult object with operation details
+        """
+        copied = []
+        missing = []
+        failed = []
+        
+        # Decide once whether per-image messages are emitted at all
+        log_info = logger.isEnabledFor(logging.INFO)
+        log_warning = logger.isEnabledFor(logging.WARNING)
+        
+        for (image, src_file, _), error in outcomes:
+            if error is None:
+                copied.append(image)
+                if log_info:
+                    logger.info("Copied: %s", image)
+            elif isinstance(error, FileExistsError):
+                if log_info:
+                    logger.info("Skipped (already exists): %s", image)
+            elif isinstance(error, FileNotFoundError) and error.filename == src_file:
+                missing.append(image)
+                if log_warning:
+                    logger.warning("Source file not found: %s", src_file)
+            else:
                 failed.append(image)
-                logger.error(f"Failed to copy {image}: {e}")
+                logger.error("Failed to copy %s: %s", image, error)
+        
+        # Sort once here so every summary can print the lists as they are
+        copied.sort()
+        missing.sort()
+        failed.sort()
         
         result = CopyResult(
             copied=copied,
             missing=missing,
             failed=failed,
-            total_attempted=len(image_list)
+            total_attempted=total_attempted
         )
         
         logger.info(f"Copy operation completed: {len(copied)} copied, "
@@ -225,6 +587,46 @@ class LaTeXImageExtractor:
         
         return result
     
+    def copy_images(self, image_list: Set[str], source_dir: str, 
+                   destination_dir: str, create_dest: bool = True) -> CopyResult:
+        """
+        Copy a list of images from source to destination directory.
+        
+        Args:
+            image_list: Set of image filenames to copy
+            source_dir: Source directory path
+            destination_dir: Destination directory path
+            create_dest: Whether to create destination directory if it doesn't exist
+            
+        Returns:
+            CopyResult object with operation details
+        """
+        tasks = self._plan_copies(image_list, source_dir, destination_dir, create_dest)
+        return self._collect_copies(_copy_in_threads(tasks), len(image_list))
+    
+    async def copy_images_async(self, image_list: Set[str], source_dir: str,
+                                destination_dir: str, create_dest: bool = True) -> CopyResult:
+        """
+        Asynchronous variant of copy_images for callers running an event loop.
+        
+        Directory preparation and every copy run in worker threads via
+        asyncio.to_thread, so the event loop is never blocked on file IO.
+        
+        Args:
+            image_list: Set of image filenames to copy
+            source_dir: Source directory path
+            destination_dir: Destination directory path
+            create_dest: Whether to create destination directory if it doesn't exist
+            
+        Returns:
+            CopyResult object with operation details
+        """
+        tasks = await asyncio.to_thread(
+            self._plan_copies, image_list, source_dir, destination_dir, create_dest
+        )
+        errors = await _acopy_many(tasks)
+        return self._collect_copies(zip(tasks, errors), len(image_list))
+    
     def print_copy_summary(self, result: CopyResult, destination_dir: str) -> None:
         """
         Print a summary of the copy operation.
@@ -233,27 +635,29 @@ class LaTeXImageExtractor:
             result: CopyResult object
             destination_dir: Destination directory for display
         """
-        print(f"\n📁 **Copy Operation Summary**")
-        print(f"   Total files attempted: {result.total_attempted}")
-        print(f"   Successfully copied: {len(result.copied)}")
-        print(f"   Missing from source: {len(result.missing)}")
-        print(f"   Failed to copy: {len(result.failed)}")
-        print(f"   Destination: {destination_dir}")
+        # Build the whole report and emit it with a single write
+        out = [
+            f"\n📁 **Copy Operation Summary**",
+            f"   Total files attempted: {result.total_attempted}",
+            f"   Successfully copied: {len(result.copied)}",
+            f"   Missing from source: {len(result.missing)}",
+            f"   Failed to copy: {len(result.failed)}",
+            f"   Destination: {destination_dir}",
+        ]
         
         if result.copied:
-            print(f"\n✅ **Successfully copied files:**")
-            for img in sorted(result.copied):
-                print(f"   ✓ {img}")
+            out.append(f"\n✅ **Successfully copied files:**")
+            out.extend(f"   ✓ {img}" for img in result.copied)
         
         if result.missing:
-            print(f"\n⚠️  **Files not found in source directory:**")
-            for img in sorted(result.missing):
-                print(f"   ? {img}")
+            out.append(f"\n⚠️  **Files not found in source directory:**")
+            out.extend(f"   ? {img}" for img in result.missing)
         
         if result.failed:
-            print(f"\n❌ **Failed to copy:**")
-            for img in sorted(result.failed):
-                print(f"   ✗ {img}")
+            out.append(f"\n❌ **Failed to copy:**")
+            out.extend(f"   ✗ {img}" for img in result.failed)
+        
+        sys.stdout.write('\n'.join(out) + '\n')
 
 class LaTeXImageManager:
     """
@@ -296,6 +700,31 @@ class LaTeXImageManager:
         
         logger.info("=== Workflow Complete ===")
         return comparison, copy_result
+    
+    def extract_and_copy_many(self, specs: List[Tuple[str, str, str, str]],
+                              workers: Optional[int] = None
+                              ) -> List[Tuple[ComparisonResult, CopyResult]]:
+        """
+        Run the complete workflow for many document pairs in parallel processes.
+        
+        Args:
+            specs: List of (old_tex, new_tex, source_dir, dest_dir) tuples
+            workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            List of (ComparisonResult, CopyResult) tuples in the order of specs
+        """
+        jobs = [(self.extractor.image_extensions, spec) for spec in specs]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_extract_and_copy_worker, jobs))
+
+def _extract_and_copy_worker(job: Tuple[List[str], Tuple[str, str, str, str]]
+                             ) -> Tuple[ComparisonResult, CopyResult]:
+    """Run one extract-and-copy workflow inside a worker process."""
+    image_extensions, spec = job
+    manager = LaTeXImageManager(image_extensions)
+    return manager.extract_and_copy_new_images(*spec)
 
 # Example usage and demonstration
 def main():
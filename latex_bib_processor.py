@@ -1,7 +1,11 @@
 import re
 import os
+import mmap
+import codecs
 from pathlib import Path
-from collections import OrderedDict
+
+def _silent(*args, **kwargs):
+    """Stand-in for print when a processor is not verbose."""
 
 class LaTeXBibProcessor:
     """
@@ -23,91 +27,218 @@ class LaTeXBibProcessor:
         processor.execute_full_process('ordered_refs.bib')
     """
     
-    def __init__(self, tex_file, bib_file):
+    # Patterns are compiled once at import and shared by all instances.
+    # Single pattern for all supported citation commands:
+    # \cite, \citep, \citet, \citealp, \citealt, \citeauthor, \citeyear,
+    # \nocite and the capitalised \Cite, \Citep, \Citet variants. LaTeX
+    # commands are case-sensitive, so the accepted capitalisation is spelled
+    # out instead of matching with re.IGNORECASE
+    _citation_re = re.compile(
+        r'\\(?:[Cc]ite(?:p|t|alp|alt|author|year)?|nocite)\{([^}]+)\}'
+    )
+    
+    # LaTeX comment: a '%' after an even run of backslashes ('\\%' is a line
+    # break followed by a comment) up to the end of the line. URL arguments,
+    # \verb and verbatim-like environments may hold a literal '%' and are
+    # matched first so they are kept intact
+    _comment_re = re.compile(
+        r'(?P<keep>\\(?:url|href)\s*\{[^}\n]*\}'
+        r'|\\verb\*?([^\sa-zA-Z*]).*?\2'
+        r'|\\begin\{(verbatim\*?|lstlisting|minted)\}[\s\S]*?\\end\{\3\})'
+        r'|(?<!\\)(?P<escapes>(?:\\\\)*)%.*$',
+        re.MULTILINE
+    )
+    
+    # A single key inside a citation's comma-separated key list
+    _key_re = re.compile(r'[^,\s]+')
+    
+    # BibTeX entry head "@type{" and the "key," following it - the body is
+    # delimited by brace counting
+    _entry_type_re = re.compile(r'@(\w+)\s*\{')
+    _entry_key_re = re.compile(r'\s*([^,\s}]+)\s*,')
+    
+    # Blocks that share the entry syntax but are not bibliography entries
+    _non_entry_types = frozenset(('comment', 'string', 'preamble'))
+    
+    # The same patterns for scanning raw (memory-mapped) BibTeX bytes
+    _entry_type_re_bytes = re.compile(rb'@(\w+)\s*\{')
+    _entry_key_re_bytes = re.compile(rb'\s*([^,\s}]+)\s*,')
+    _non_entry_types_bytes = frozenset((b'comment', b'string', b'preamble'))
+    
+    def __init__(self, tex_file, bib_file, verbose=True, lazy=False):
         """
         Initialize the processor with LaTeX and BibTeX file paths.
         
         Args:
             tex_file (str): Path to the LaTeX file
             bib_file (str): Path to the BibTeX file
+            verbose (bool): Print progress and reports; errors are always printed
+            lazy (bool): Memory-map the .bib file and only index entry offsets,
+                decoding just the cited entries; bib_entries stays empty
         """
         self.tex_file = tex_file
         self.bib_file = bib_file
+        self.verbose = verbose
+        self.lazy = lazy
+        self._log = print if verbose else _silent
         self.tex_content = ""
         self.bib_content = ""
+        self._stripped_tex = ""  # tex_content without comments
         
         # Citation tracking
         self.cited_keys = []  # All citations in order (with duplicates)
         self.unique_cited_keys = []  # Unique citations preserving order
+        self._cited_set = frozenset()  # Set view of unique_cited_keys
         
         # BibTeX data
         self.bib_entries = {}  # key -> complete entry content
         self.bib_keys = set()  # All available keys in .bib
+        self._bib_map = b""  # Memory-mapped .bib file (lazy mode)
+        self._offsets = {}  # key -> (start, end) in _bib_map (lazy mode)
+        self._bib_encoding = 'utf-8'  # Encoding chosen for _bib_map (lazy mode)
         
         # Analysis results
         self.missing_keys = []  # Cited but not in .bib
         self.unused_keys = []   # In .bib but not cited
-        self.ordered_entries = OrderedDict()  # Final ordered entries
-        
-        # Comprehensive citation command patterns
-        self.citation_patterns = [
-            r'\\cite\{([^}]+)\}',           # \cite{key1,key2}
-            r'\\citep\{([^}]+)\}',          # \citep{key1,key2}
-            r'\\citet\{([^}]+)\}',          # \citet{key1,key2}
-            r'\\citealp\{([^}]+)\}',        # \citealp{key1,key2}
-            r'\\citealt\{([^}]+)\}',        # \citealt{key1,key2}
-            r'\\citeauthor\{([^}]+)\}',     # \citeauthor{key1,key2}
-            r'\\citeyear\{([^}]+)\}',       # \citeyear{key1,key2}
-            r'\\nocite\{([^}]+)\}',         # \nocite{key1,key2}
-            r'\\Cite\{([^}]+)\}',           # \Cite{key1,key2}
-            r'\\Citep\{([^}]+)\}',          # \Citep{key1,key2}
-            r'\\Citet\{([^}]+)\}',          # \Citet{key1,key2}
-        ]
+        self.ordered_entries = {}  # Final ordered entries
+    
+    @staticmethod
+    def _decode(raw, encoding=None):
+        """
+        Decode raw bytes in a single call.
+        
+        UTF-8 is tried first, falling back to latin-1 on the same bytes.
+        Line endings are normalised to '\\n' as a text-mode read would.
         
-        # Enhanced BibTeX entry pattern - handles complex nested structures
-        self.bib_entry_pattern = re.compile(
-            r'(@\w+\s*\{\s*([^,\s}]+)\s*,.*?)(?=\n\s*@|\n\s*$|\Z)',
-            re.DOTALL | re.MULTILINE
-        )
+        Args:
+            raw (bytes): Undecoded file content
+            encoding (str, optional): Encoding already chosen for the whole
+                file (see _detect_encoding), used instead of trying UTF-8
+            
+        Returns:
+            tuple: (decoded text, encoding used)
+        """
+        if encoding is not None:
+            text = raw.decode(encoding)
+        else:
+            try:
+                text = raw.decode('utf-8')
+                encoding = 'utf-8'
+            except UnicodeDecodeError:
+                text = raw.decode('latin-1')
+                encoding = 'latin-1'
+        
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        
+        return text, encoding
+    
+    @classmethod
+    def _read_source(cls, path):
+        """
+        Read a file as raw bytes and decode it, never reading it twice.
+        
+        Args:
+            path (str): Path to the file
+            
+        Returns:
+            tuple: (decoded text, encoding used)
+        """
+        return cls._decode(Path(path).read_bytes())
+    
+    @staticmethod
+    def _detect_encoding(buf):
+        """
+        Pick the encoding _decode would use for buf without decoding it whole.
+        
+        The bytes are validated as UTF-8 in 1 MB chunks, so a memory-mapped
+        file is never held as one decoded string.
+        
+        Args:
+            buf (bytes or mmap.mmap): Undecoded file content
+            
+        Returns:
+            str: 'utf-8' if buf is valid UTF-8, otherwise 'latin-1'
+        """
+        chunk = 1 << 20
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        try:
+            for pos in range(0, len(buf), chunk):
+                decoder.decode(buf[pos:pos + chunk])
+            decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            return 'latin-1'
+        return 'utf-8'
+    
+    def _map_bib_file(self):
+        """Memory-map the BibTeX file read-only (lazy mode)."""
+        with open(self.bib_file, 'rb') as f:
+            # Empty files cannot be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def close(self):
+        """Release the memory-mapped BibTeX file (lazy mode); safe to call twice."""
+        if isinstance(self._bib_map, mmap.mmap):
+            self._bib_map.close()
+        self._bib_map = b""
+        self._offsets = {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
     
     def load_files(self):
         """Load and validate both LaTeX and BibTeX files."""
         # Load LaTeX file
         try:
-            with open(self.tex_file, 'r', encoding='utf-8') as f:
-                self.tex_content = f.read()
-            print(f"✓ Successfully loaded LaTeX file: {self.tex_file}")
-            print(f"  File size: {len(self.tex_content):,} characters")
+            self.tex_content, encoding = self._read_source(self.tex_file)
         except FileNotFoundError:
             raise FileNotFoundError(f"LaTeX file not found: {self.tex_file}")
-        except UnicodeDecodeError:
-            # Try alternative encodings
-            try:
-                with open(self.tex_file, 'r', encoding='latin-1') as f:
-                    self.tex_content = f.read()
-                print(f"✓ Loaded LaTeX file with latin-1 encoding: {self.tex_file}")
-            except Exception as e:
-                raise Exception(f"Error reading LaTeX file with multiple encodings: {e}")
         except Exception as e:
             raise Exception(f"Error reading LaTeX file: {e}")
         
+        if encoding == 'utf-8':
+            self._log(f"✓ Successfully loaded LaTeX file: {self.tex_file}")
+            self._log(f"  File size: {len(self.tex_content):,} characters")
+        else:
+            self._log(f"✓ Loaded LaTeX file with latin-1 encoding: {self.tex_file}")
+        
         # Load BibTeX file
+        if self.lazy:
+            self.close()
+            try:
+                self._bib_map = self._map_bib_file()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"BibTeX file not found: {self.bib_file}")
+            except Exception as e:
+                raise Exception(f"Error reading BibTeX file: {e}")
+            
+            # One encoding for the whole file, exactly as eager mode decides it
+            self._bib_encoding = self._detect_encoding(self._bib_map)
+            
+            self._log(f"✓ Memory-mapped BibTeX file (lazy mode): {self.bib_file}")
+            self._log(f"  File size: {len(self._bib_map):,} bytes")
+            if self._bib_encoding != 'utf-8':
+                self._log(f"  Encoding: {self._bib_encoding}")
+            return
+        
         try:
-            with open(self.bib_file, 'r', encoding='utf-8') as f:
-                self.bib_content = f.read()
-            print(f"✓ Successfully loaded BibTeX file: {self.bib_file}")
-            print(f"  File size: {len(self.bib_content):,} characters")
+            self.bib_content, encoding = self._read_source(self.bib_file)
         except FileNotFoundError:
             raise FileNotFoundError(f"BibTeX file not found: {self.bib_file}")
-        except UnicodeDecodeError:
-            try:
-                with open(self.bib_file, 'r', encoding='latin-1') as f:
-                    self.bib_content = f.read()
-                print(f"✓ Loaded BibTeX file with latin-1 encoding: {self.bib_file}")
-            except Exception as e:
-                raise Exception(f"Error reading BibTeX file with multiple encodings: {e}")
         except Exception as e:
             raise Exception(f"Error reading BibTeX file: {e}")
+        
+        if encoding == 'utf-8':
+            self._log(f"✓ Successfully loaded BibTeX file: {self.bib_file}")
+            self._log(f"  File size: {len(self.bib_content):,} characters")
+        else:
+            self._log(f"✓ Loaded BibTeX file with latin-1 encoding: {self.bib_file}")
     
     def extract_citations_from_tex(self):
         """
@@ -115,63 +246,153 @@ class LaTeXBibProcessor:
         Supports multiple citation commands and handles comma-separated keys.
         """
         self.cited_keys = []
-        citations_with_pos = []
-        
-        # Process each citation pattern
-        for pattern in self.citation_patterns:
-            matches = re.finditer(pattern, self.tex_content, re.IGNORECASE)
-            for match in matches:
-                pos = match.start()
-                keys_str = match.group(1)
-                
-                # Handle comma-separated keys
-                keys = [key.strip() for key in keys_str.split(',')]
-                for key in keys:
-                    if key and not key.isspace():  # Skip empty or whitespace-only keys
-                        citations_with_pos.append((pos, key))
-        
-        # Sort by position to maintain document order
-        citations_with_pos.sort(key=lambda x: x[0])
-        
-        # Extract ordered keys
-        self.cited_keys = [key for pos, key in citations_with_pos]
+        
+        # Drop comments first: commented-out citations are not real ones, and
+        # the patterns below then scan less text
+        content = self.tex_content
+        if '%' in content:
+            content = self._comment_re.sub(r'\g<keep>\g<escapes>', content)
+        self._stripped_tex = content
+        
+        # Cheap literal probe first: files without any citation command
+        # (figure-only chapters, included fragments) skip the regex entirely
+        if '\\cite' in content or '\\Cite' in content or '\\nocite' in content:
+            matches = self._citation_re.finditer(content)
+        else:
+            matches = ()
+        
+        # One scan over the document yields citations already in order
+        extend = self.cited_keys.extend
+        find_keys = self._key_re.findall
+        for match in matches:
+            # Comma-separated keys come back stripped, empty ones never match
+            extend(find_keys(match.group(1)))
         
         # Create unique list preserving first appearance order
-        seen = set()
-        self.unique_cited_keys = []
-        for key in self.cited_keys:
-            if key not in seen:
-                self.unique_cited_keys.append(key)
-                seen.add(key)
+        unique = dict.fromkeys(self.cited_keys)
+        self.unique_cited_keys = list(unique)
+        self._cited_set = unique.keys()
         
-        print(f"✓ Citation extraction completed:")
-        print(f"  Total citations found: {len(self.cited_keys)}")
-        print(f"  Unique citation keys: {len(self.unique_cited_keys)}")
+        self._log(f"✓ Citation extraction completed:")
+        self._log(f"  Total citations found: {len(self.cited_keys)}")
+        self._log(f"  Unique citation keys: {len(self.unique_cited_keys)}")
         
         return self.unique_cited_keys
     
+    def _iter_entry_spans(self, buf):
+        """
+        Yield (key, start, end) for every BibTeX entry in buf, in file order.
+        
+        Each entry runs from its '@' to the brace closing the entry, found by
+        counting nested braces in a single linear scan. An entry whose braces
+        never balance ends where the next line starting with '@' begins.
+        @comment, @string and @preamble blocks are skipped. The buffer is
+        searched as is; only the short type name is lowercased.
+        
+        Args:
+            buf (str | bytes | mmap.mmap): BibTeX source; keys are returned
+                as the same type (bytes for an mmap)
+        """
+        if isinstance(buf, str):
+            match_type = self._entry_type_re.match
+            match_key = self._entry_key_re.match
+            non_entry_types = self._non_entry_types
+            at, open_brace, close_brace, line_at = '@', '{', '}', '\n@'
+        else:
+            match_type = self._entry_type_re_bytes.match
+            match_key = self._entry_key_re_bytes.match
+            non_entry_types = self._non_entry_types_bytes
+            at, open_brace, close_brace, line_at = b'@', b'{', b'}', b'\n@'
+        find = buf.find
+        
+        start = find(at)
+        while start != -1:
+            head = match_type(buf, start)
+            if head is None:
+                start = find(at, start + 1)
+                continue
+            
+            body = head.end()
+            if head.group(1).lower() in non_entry_types:
+                key = None
+            else:
+                key_match = match_key(buf, body)
+                if key_match is None:
+                    start = find(at, start + 1)
+                    continue
+                key = key_match.group(1)
+                body = key_match.end()
+            
+            # Walk the braces, remembering the next '{' and '}' so that each
+            # character is searched at most once
+            pos = body
+            depth = 1
+            next_open = find(open_brace, pos)
+            next_close = find(close_brace, pos)
+            while depth and next_close != -1:
+                if next_open != -1 and next_open < next_close:
+                    depth += 1
+                    next_open = find(open_brace, next_open + 1)
+                else:
+                    depth -= 1
+                    pos = next_close + 1
+                    next_close = find(close_brace, pos)
+            
+            if depth:
+                # Unbalanced entry: stop at the next entry instead of the file end
+                end = find(line_at, body)
+                if end == -1:
+                    end = len(buf)
+            else:
+                end = pos
+            
+            if key is not None:
+                yield key, start, end
+            start = find(at, end)
+    
+    def _iter_entries(self, buf):
+        """
+        Yield (key, entry) for every BibTeX entry in buf, in file order.
+        
+        Args:
+            buf (str): BibTeX source text
+        """
+        for key, start, end in self._iter_entry_spans(buf):
+            yield key, buf[start:end]
+    
     def parse_bib_entries(self):
         """
         Parse all BibTeX entries from .bib file.
         Preserves original formatting and handles complex entry structures.
         """
-        self.bib_entries = {}
+        self.bib_entries = bib_entries = {}
         self.bib_keys = set()
-        
-        # Find all BibTeX entries
-        matches = self.bib_entry_pattern.findall(self.bib_content)
-        
-        for full_entry, key in matches:
-            # Clean and validate key
-            clean_key = key.strip()
-            if clean_key:  # Skip empty keys
-                self.bib_keys.add(clean_key)
-                # Store complete entry preserving original formatting
-                self.bib_entries[clean_key] = full_entry.strip()
-        
-        print(f"✓ BibTeX parsing completed:")
-        print(f"  Total entries parsed: {len(self.bib_entries)}")
-        print(f"  Valid entry keys: {len(self.bib_keys)}")
+        self._offsets = offsets = {}
+        add_key = self.bib_keys.add
+        
+        if self.lazy:
+            # Only index where each entry lives; cited ones are decoded later
+            encoding = self._bib_encoding
+            for key, start, end in self._iter_entry_spans(self._bib_map):
+                clean_key = key.decode(encoding)
+                if clean_key:  # Skip empty keys
+                    add_key(clean_key)
+                    offsets[clean_key] = (start, end)
+            entry_count = len(offsets)
+        else:
+            # Stream BibTeX entries one at a time
+            for key, full_entry in self._iter_entries(self.bib_content):
+                # Clean and validate key
+                clean_key = key.strip()
+                if clean_key:  # Skip empty keys
+                    add_key(clean_key)
+                    # Store complete entry preserving original formatting
+                    bib_entries[clean_key] = full_entry.strip()
+            entry_count = len(bib_entries)
+        
+        self._log(f"✓ BibTeX parsing completed:")
+        self._log(f"  Total entries parsed: {entry_count}")
+        self._log(f"  Valid entry keys: {len(self.bib_keys)}")
         
         return self.bib_entries
     
@@ -180,65 +401,82 @@ class LaTeXBibProcessor:
         Perform comprehensive citation analysis.
         Identifies missing citations and unused bibliography entries.
         """
-        cited_set = set(self.unique_cited_keys)
-        
         # Identify missing entries (cited in .tex but not in .bib)
-        self.missing_keys = [key for key in self.unique_cited_keys if key not in self.bib_keys]
+        bib_keys = self.bib_keys
+        self.missing_keys = [key for key in self.unique_cited_keys if key not in bib_keys]
         
         # Identify unused entries (in .bib but not cited in .tex)
-        self.unused_keys = sorted(list(self.bib_keys - cited_set))
+        self.unused_keys = sorted(self.bib_keys.difference(self._cited_set))
         
         # Calculate statistics
         total_cited = len(self.unique_cited_keys)
         total_in_bib = len(self.bib_keys)
         available = total_cited - len(self.missing_keys)
         
-        print(f"\n📊 **Citation Analysis Summary**")
-        print(f"   • Unique citations in LaTeX: {total_cited}")
-        print(f"   • Total entries in BibTeX: {total_in_bib}")
-        print(f"   • Available entries: {available}")
-        print(f"   • Missing entries: {len(self.missing_keys)}")
-        print(f"   • Unused entries: {len(self.unused_keys)}")
+        self._log(f"\n📊 **Citation Analysis Summary**")
+        self._log(f"   • Unique citations in LaTeX: {total_cited}")
+        self._log(f"   • Total entries in BibTeX: {total_in_bib}")
+        self._log(f"   • Available entries: {available}")
+        self._log(f"   • Missing entries: {len(self.missing_keys)}")
+        self._log(f"   • Unused entries: {len(self.unused_keys)}")
         
         return self.missing_keys, self.unused_keys
     
     def print_detailed_analysis(self):
         """Print comprehensive analysis results with actionable information."""
+        if not self.verbose:
+            return
         
         if self.missing_keys:
-            print(f"\n❌ **Missing Bibliography Entries** ({len(self.missing_keys)} items)")
-            print("   The following citations appear in your LaTeX file but are missing from the BibTeX file:")
-            print("   " + "-" * 70)
+            self._log(f"\n❌ **Missing Bibliography Entries** ({len(self.missing_keys)} items)")
+            self._log("   The following citations appear in your LaTeX file but are missing from the BibTeX file:")
+            self._log("   " + "-" * 70)
             for i, key in enumerate(self.missing_keys, 1):
-                print(f"   {i:2d}. {key}")
-            print("\n   ⚠️  Action Required: Add these entries to your .bib file or remove citations from .tex")
+                self._log(f"   {i:2d}. {key}")
+            self._log("\n   ⚠️  Action Required: Add these entries to your .bib file or remove citations from .tex")
         
         if self.unused_keys:
-            print(f"\n🗑️  **Unused Bibliography Entries** ({len(self.unused_keys)} items)")
-            print("   The following entries exist in your BibTeX file but are not cited:")
-            print("   " + "-" * 70)
+            self._log(f"\n🗑️  **Unused Bibliography Entries** ({len(self.unused_keys)} items)")
+            self._log("   The following entries exist in your BibTeX file but are not cited:")
+            self._log("   " + "-" * 70)
             for i, key in enumerate(self.unused_keys, 1):
-                print(f"   {i:2d}. {key}")
-            print("\n   ℹ️  These entries will be excluded from the ordered output file")
+                self._log(f"   {i:2d}. {key}")
+            self._log("\n   ℹ️  These entries will be excluded from the ordered output file")
         
         if not self.missing_keys and not self.unused_keys:
-            print(f"\n✅ **Perfect Bibliography Match**")
-            print("   All citations have corresponding entries, and no unused entries found!")
+            self._log(f"\n✅ **Perfect Bibliography Match**")
+            self._log("   All citations have corresponding entries, and no unused entries found!")
     
     def create_ordered_bib(self):
         """
         Create ordered BibTeX entries based on citation order in LaTeX file.
         Only includes entries that are both cited and available in the .bib file.
         """
-        self.ordered_entries = OrderedDict()
-        
-        for key in self.unique_cited_keys:
-            if key in self.bib_entries:
-                self.ordered_entries[key] = self.bib_entries[key]
-        
-        print(f"\n✓ Created ordered bibliography:")
-        print(f"  Entries included: {len(self.ordered_entries)}")
-        print(f"  Ordering based on: Citation appearance in LaTeX file")
+        self.ordered_entries = {}
+        
+        ordered_entries = self.ordered_entries
+        
+        if self.lazy:
+            # Decode just the cited entries straight from the mapped file
+            bib_map = self._bib_map
+            get_span = self._offsets.get
+            decode = self._decode
+            encoding = self._bib_encoding
+            for key in self.unique_cited_keys:
+                span = get_span(key)
+                if span is not None:
+                    ordered_entries[key] = decode(bib_map[span[0]:span[1]], encoding)[0].strip()
+        else:
+            # One lookup per cited key instead of a membership test plus an index
+            get_entry = self.bib_entries.get
+            for key in self.unique_cited_keys:
+                entry = get_entry(key)
+                if entry is not None:
+                    ordered_entries[key] = entry
+        
+        self._log(f"\n✓ Created ordered bibliography:")
+        self._log(f"  Entries included: {len(self.ordered_entries)}")
+        self._log(f"  Ordering based on: Citation appearance in LaTeX file")
         
         return self.ordered_entries
     
@@ -256,24 +494,31 @@ class LaTeXBibProcessor:
             print("⚠️  No entries to save. Run create_ordered_bib() first.")
             return False
         
+        # Header comment
+        parts = [
+            f"% Ordered Bibliography File\n",
+            f"% Generated from: {self.tex_file} and {self.bib_file}\n",
+            f"% Total entries: {len(self.ordered_entries)}\n",
+            f"% Ordered by citation appearance in LaTeX document\n\n",
+        ]
+        
+        # Entries with proper spacing
+        append = parts.append
+        for i, entry in enumerate(self.ordered_entries.values()):
+            if i > 0:  # Add separation between entries
+                append('\n')
+            append(entry)
+            if entry[-1:] != '\n':
+                append('\n')
+        
         try:
+            # Build the whole file in memory and write it in one call
             with open(output_file, 'w', encoding='utf-8') as f:
-                # Write header comment
-                f.write(f"% Ordered Bibliography File\n")
-                f.write(f"% Generated from: {self.tex_file} and {self.bib_file}\n")
-                f.write(f"% Total entries: {len(self.ordered_entries)}\n")
-                f.write(f"% Ordered by citation appearance in LaTeX document\n\n")
-                
-                # Write entries with proper spacing
-                for i, (key, entry) in enumerate(self.ordered_entries.items()):
-                    if i > 0:  # Add separation between entries
-                        f.write('\n')
-                    f.write(entry)
-                    if not entry.endswith('\n'):
-                        f.write('\n')
+                f.write(''.join(parts))
             
-            print(f"✅ **Success**: Ordered BibTeX file saved as '{output_file}'")
-            print(f"   📁 File location: {os.path.abspath(output_file)}")
+            if self.verbose:
+                self._log(f"✅ **Success**: Ordered BibTeX file saved as '{output_file}'")
+                self._log(f"   📁 File location: {os.path.abspath(output_file)}")
             return True
             
         except Exception as e:
@@ -285,27 +530,34 @@ class LaTeXBibProcessor:
         Display the citation order for verification purposes.
         
         Args:
-            max_display (int): Maximum number of entries to display
+            max_display (int): Maximum number of entries to display; 0 disables the preview
         """
+        if not self.verbose or max_display <= 0:
+            return
+        
         display_count = min(max_display, len(self.unique_cited_keys))
         
-        print(f"\n📋 **Citation Order Preview** (showing first {display_count} of {len(self.unique_cited_keys)} entries)")
-        print("=" * 80)
-        print("Order | Status | Citation Key")
-        print("-" * 80)
+        self._log(f"\n📋 **Citation Order Preview** (showing first {display_count} of {len(self.unique_cited_keys)} entries)")
+        self._log("=" * 80)
+        self._log("Order | Status | Citation Key")
+        self._log("-" * 80)
         
+        available = self.bib_keys.__contains__
         for i, key in enumerate(self.unique_cited_keys[:display_count], 1):
-            status = "✓ Available" if key in self.bib_entries else "❌ Missing"
-            print(f"{i:5d} | {status:11s} | {key}")
+            status = "✓ Available" if available(key) else "❌ Missing"
+            self._log(f"{i:5d} | {status:11s} | {key}")
         
         if len(self.unique_cited_keys) > max_display:
             remaining = len(self.unique_cited_keys) - max_display
-            print(f"      | ...        | ... and {remaining} more entries")
+            self._log(f"      | ...        | ... and {remaining} more entries")
         
-        print("=" * 80)
+        self._log("=" * 80)
     
     def generate_comprehensive_report(self):
         """Generate a detailed summary report of the entire process."""
+        if not self.verbose:
+            return
+        
         total_cited = len(self.unique_cited_keys)
         total_in_bib = len(self.bib_keys)
         available_entries = len(self.ordered_entries)
@@ -316,35 +568,35 @@ class LaTeXBibProcessor:
         coverage = (available_entries / total_cited * 100) if total_cited > 0 else 0
         efficiency = (available_entries / total_in_bib * 100) if total_in_bib > 0 else 0
         
-        print(f"\n" + "=" * 90)
-        print(f"📊 **COMPREHENSIVE PROCESSING REPORT**")
-        print(f"=" * 90)
+        self._log(f"\n" + "=" * 90)
+        self._log(f"📊 **COMPREHENSIVE PROCESSING REPORT**")
+        self._log(f"=" * 90)
         
-        print(f"📄 **Source Files:**")
-        print(f"   • LaTeX document: {self.tex_file}")
-        print(f"   • BibTeX database: {self.bib_file}")
+        self._log(f"📄 **Source Files:**")
+        self._log(f"   • LaTeX document: {self.tex_file}")
+        self._log(f"   • BibTeX database: {self.bib_file}")
         
-        print(f"\n📈 **Processing Statistics:**")
-        print(f"   • Total citations in LaTeX: {len(self.cited_keys):,} (including duplicates)")
-        print(f"   • Unique citation keys: {total_cited:,}")
-        print(f"   • Total BibTeX entries: {total_in_bib:,}")
-        print(f"   • Successfully matched: {available_entries:,}")
-        print(f"   • Missing from BibTeX: {missing_count:,}")
-        print(f"   • Unused in BibTeX: {unused_count:,}")
+        self._log(f"\n📈 **Processing Statistics:**")
+        self._log(f"   • Total citations in LaTeX: {len(self.cited_keys):,} (including duplicates)")
+        self._log(f"   • Unique citation keys: {total_cited:,}")
+        self._log(f"   • Total BibTeX entries: {total_in_bib:,}")
+        self._log(f"   • Successfully matched: {available_entries:,}")
+        self._log(f"   • Missing from BibTeX: {missing_count:,}")
+        self._log(f"   • Unused in BibTeX: {unused_count:,}")
         
-        print(f"\n📊 **Quality Metrics:**")
-        print(f"   • Citation Coverage: {coverage:.1f}% ({available_entries}/{total_cited})")
-        print(f"   • BibTeX Efficiency: {efficiency:.1f}% ({available_entries}/{total_in_bib})")
+        self._log(f"\n📊 **Quality Metrics:**")
+        self._log(f"   • Citation Coverage: {coverage:.1f}% ({available_entries}/{total_cited})")
+        self._log(f"   • BibTeX Efficiency: {efficiency:.1f}% ({available_entries}/{total_in_bib})")
         
-        print(f"\n🎯 **Recommendations:**")
+        self._log(f"\n🎯 **Recommendations:**")
         if missing_count > 0:
-            print(f"   • Add {missing_count} missing entries to improve coverage")
+            self._log(f"   • Add {missing_count} missing entries to improve coverage")
         if unused_count > 0:
-            print(f"   • Consider removing {unused_count} unused entries to improve efficiency")
+            self._log(f"   • Consider removing {unused_count} unused entries to improve efficiency")
         if missing_count == 0 and unused_count == 0:
-            print(f"   • Bibliography is perfectly optimized!")
+            self._log(f"   • Bibliography is perfectly optimized!")
         
-        print(f"=" * 90)
+        self._log(f"=" * 90)
     
     def execute_full_process(self, output_file="refs_ordered.bib"):
         """
@@ -356,50 +608,53 @@ class LaTeXBibProcessor:
         Returns:
             bool: True if process completed successfully, False otherwise
         """
-        print("🚀 === LaTeX Bibliography Processing Started ===\n")
+        self._log("🚀 === LaTeX Bibliography Processing Started ===\n")
         
         try:
             # Step 1: Load and validate files
-            print("📂 Step 1: Loading files...")
+            self._log("📂 Step 1: Loading files...")
             self.load_files()
             
             # Step 2: Extract citations from LaTeX
-            print("\n🔍 Step 2: Extracting citations from LaTeX...")
+            self._log("\n🔍 Step 2: Extracting citations from LaTeX...")
             self.extract_citations_from_tex()
             
             # Step 3: Parse BibTeX entries
-            print("\n📚 Step 3: Parsing BibTeX entries...")
+            self._log("\n📚 Step 3: Parsing BibTeX entries...")
             self.parse_bib_entries()
             
             # Step 4: Analyze citations and entries
-            print("\n🔬 Step 4: Analyzing citations...")
+            self._log("\n🔬 Step 4: Analyzing citations...")
             self.analyze_citations()
             
             # Step 5: Display detailed analysis
-            print("\n📋 Step 5: Detailed analysis results...")
+            self._log("\n📋 Step 5: Detailed analysis results...")
             self.print_detailed_analysis()
             
             # Step 6: Show citation order preview
-            print("\n👀 Step 6: Citation order preview...")
+            self._log("\n👀 Step 6: Citation order preview...")
             self.print_citation_order()
             
             # Step 7: Create ordered bibliography
-            print("\n⚡ Step 7: Creating ordered bibliography...")
+            self._log("\n⚡ Step 7: Creating ordered bibliography...")
             self.create_ordered_bib()
             
+            # Cited entries are decoded now, so release the mapped .bib file
+            self.close()
+            
             # Step 8: Save ordered file
-            print("\n💾 Step 8: Saving ordered BibTeX file...")
+            self._log("\n💾 Step 8: Saving ordered BibTeX file...")
             success = self.save_ordered_bib(output_file)
             
             # Step 9: Generate comprehensive report
-            print("\n📊 Step 9: Generating final report...")
+            self._log("\n📊 Step 9: Generating final report...")
             self.generate_comprehensive_report()
             
             # Final status
             if success:
-                print(f"\n🎉 **PROCESS COMPLETED SUCCESSFULLY**")
-                print(f"📁 **Output file**: {output_file}")
-                print(f"✨ **Ready to use**: Your ordered bibliography is ready!")
+                self._log(f"\n🎉 **PROCESS COMPLETED SUCCESSFULLY**")
+                self._log(f"📁 **Output file**: {output_file}")
+                self._log(f"✨ **Ready to use**: Your ordered bibliography is ready!")
             else:
                 print(f"\n⚠️  **PROCESS COMPLETED WITH ISSUES**")
                 print(f"❌ **File save failed**: Check permissions and try again")
@@ -410,6 +665,8 @@ class LaTeXBibProcessor:
             print(f"\n💥 **CRITICAL ERROR**: {e}")
             print(f"❌ **Process terminated**: Please check your input files and try again")
             return False
+        finally:
+            self.close()
 
 # Usage example for your specific files
 if __name__ == "__main__":
@@ -1,7 +1,11 @@
 import re
 import os
+import sys
+import functools
+import multiprocessing
 import shutil
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 import logging
@@ -23,7 +27,7 @@ class ImageInfo:
 class FigureEnvironment:
     """Data class to store figure environment information"""
     position: int
-    content: str
+    end: int  # Text is tex_content[position:end]
     images: List[ImageInfo]
 
 @dataclass
@@ -33,6 +37,16 @@ class ProcessingResult:
     original_path: str
     new_path: str
     needs_rename: bool
+    source_filename: str = ""  # Filename part of original_path
+    new_filename: str = ""     # Filename part of new_path
+    
+    def __post_init__(self):
+        # Derive the filenames when the caller didn't pass them, so a result
+        # never targets the reset folder itself
+        if not self.source_filename:
+            self.source_filename = self.original_path.rpartition('/')[2]
+        if not self.new_filename:
+            self.new_filename = self.new_path.rpartition('/')[2]
 
 class TeXFigureProcessor:
     """
@@ -44,52 +58,69 @@ class TeXFigureProcessor:
     IMAGE_EXTENSIONS = {'.pdf', '.png', '.jpg', '.jpeg', '.eps', '.svg'}
     FIGURE_KEYWORDS = {'figure', 'fig', 'image'}
     
-    def __init__(self, tex_file: str):
+    # Extension check on the lowercased tail only, not the whole path
+    _EXT_TUPLE = tuple(IMAGE_EXTENSIONS)
+    _EXT_TAIL = max(len(ext) for ext in IMAGE_EXTENSIONS)
+    
+    # Regex patterns, compiled once and shared by all instances.
+    # Single token pattern driving the figure scan: figure boundaries
+    # (including figure*), includegraphics commands and the appendix marker
+    token_pattern = re.compile(
+        r'(\\begin\{figure\*?\})'
+        r'|(\\end\{figure\*?\})'
+        r'|(\\includegraphics(?:\s*\[[^\]]*\])*\s*\{)([^}]+)(\})'
+        r'|(\\appendix\b)'
+    )
+    
+    # Appendix marker alone, for lookups before the figure scan has run
+    appendix_pattern = re.compile(r'\\appendix\b')
+    
+    # Case-insensitive image-related keyword anywhere in a path
+    image_keyword_pattern = re.compile(
+        '|'.join(re.escape(keyword) for keyword in sorted(FIGURE_KEYWORDS)),
+        re.IGNORECASE
+    )
+    
+    # Pattern for existing figure prefixes
+    prefix_pattern = re.compile(r'^fig_s?(\d+)_(.+)$')
+    
+    def __init__(self, tex_file: str, filter_non_images: bool = False):
         """
         Initialize the processor with a LaTeX file.
         
         Args:
             tex_file: Path to the LaTeX file to process
+            filter_non_images: Skip \\includegraphics paths that is_image_file()
+                does not recognise (only useful for malformed documents)
         """
         self.tex_file = Path(tex_file)
         if not self.tex_file.exists():
             raise FileNotFoundError(f"LaTeX file not found: {tex_file}")
             
-        self.tex_content = ""
-        self.modifications: Dict[str, str] = {}
+        self.filter_non_images = filter_non_images
+        self.tex_content: Optional[str] = None  # Loaded on first use
+        self.modifications: List[Tuple[int, int, str]] = []  # (start, end, replacement) spans
         self.results: List[ProcessingResult] = []
         self.figure_environments: List[FigureEnvironment] = []
+        self._appendix_pos: Optional[int] = None  # Set while scanning figures
+        self._figures_scanned = False  # Whether _appendix_pos is authoritative
         
-        # Compile regex patterns
-        self._compile_patterns()
+        # Summary counters, tallied while figures are analyzed
+        self._main_figure_count = 0
+        self._appendix_figure_count = 0
+        self._main_images = 0
+        self._appendix_images = 0
+        self._modified_count = 0
+        
+        # The same paths recur (subfigures, appendix reuse), so memoize decisions
+        self._is_image_file_cached = functools.lru_cache(maxsize=4096)(self._is_image_file_impl)
         
         logger.info(f"Initialized processor for: {self.tex_file}")
     
-    def _compile_patterns(self):
-        """Compile all regex patterns used in processing"""
-        # Pattern for includegraphics commands
-        self.img_pattern = re.compile(
-            r'(\\includegraphics(?:\s*\[[^\]]*\])*\s*\{)([^}]+)(\})',
-            re.MULTILINE
-        )
-        
-        # Pattern for figure environments (including figure*)
-        self.figure_pattern = re.compile(
-            r'\\begin\{figure\*?\}.*?\\end\{figure\*?\}',
-            re.DOTALL | re.MULTILINE
-        )
-        
-        # Pattern for existing figure prefixes
-        self.prefix_pattern = re.compile(r'^fig_s?(\d+)_(.+)$')
-        
-        # Pattern for appendix
-        self.appendix_pattern = re.compile(r'\\appendix\b')
-    
     def load_tex_file(self) -> None:
         """Load the LaTeX file content"""
         try:
-            with open(self.tex_file, 'r', encoding='utf-8') as f:
-                self.tex_content = f.read()
+            self.tex_content = self.tex_file.read_text(encoding='utf-8')
             logger.info(f"Loaded LaTeX file: {self.tex_file}")
         except Exception as e:
             logger.error(f"Failed to load LaTeX file: {e}")
@@ -105,72 +136,74 @@ class TeXFigureProcessor:
         Returns:
             True if the path appears to be an image file
         """
-        path_lower = path.lower()
-        
+        return self._is_image_file_cached(path)
+    
+    def _is_image_file_impl(self, path: str) -> bool:
+        """Uncached implementation of is_image_file."""
         # Check file extension
-        if any(path_lower.endswith(ext) for ext in self.IMAGE_EXTENSIONS):
+        if path[-self._EXT_TAIL:].lower().endswith(self._EXT_TUPLE):
             return True
         
-        # Check if path contains image-related keywords
-        if any(keyword in path_lower for keyword in self.FIGURE_KEYWORDS):
-            return True
-            
-        # Check if it's a file without extension in a figures directory
-        path_obj = Path(path)
-        if not path_obj.suffix and any(keyword in path_lower for keyword in self.FIGURE_KEYWORDS):
-            return True
-            
-        return False
+        # Check for image-related keywords; this also covers an extensionless
+        # path in a figures directory
+        return self.image_keyword_pattern.search(path) is not None
     
     def extract_figure_environments(self) -> List[FigureEnvironment]:
         """
         Extract all figure environments and their contained images.
         
+        The document is scanned once for figure boundaries, image commands and
+        the appendix marker; images are assigned to the figure enclosing them.
+        
         Returns:
             List of FigureEnvironment objects
         """
-        if not self.tex_content:
+        if self.tex_content is None:
             self.load_tex_file()
         
-        figure_matches = list(self.figure_pattern.finditer(self.tex_content))
+        content = self.tex_content
+        # Every \includegraphics argument is an image to LaTeX; only apply the
+        # heuristic when explicitly asked to
+        is_image = self.is_image_file if self.filter_non_images else None
+        figure_start = None  # Start of the open figure environment, if any
+        images_in_figure = []
         
-        for match in figure_matches:
-            figure_content = match.group(0)
-            figure_start = match.start()
+        for match in self.token_pattern.finditer(content):
+            kind = match.lastindex
             
-            # Find all images in this figure environment
-            images_in_figure = []
-            img_matches = self.img_pattern.findall(figure_content)
+            if kind == 1:  # \begin{figure} / \begin{figure*}
+                if figure_start is None:
+                    figure_start = match.start()
+                    images_in_figure = []
             
-            for img_match in img_matches:
-                image_path = img_match[1].strip()
-                if self.is_image_file(image_path):
-                    full_command = img_match[0] + img_match[1] + img_match[2]
-                    # Find exact position in document
-                    cmd_start = self.tex_content.find(full_command, figure_start)
-                    
-                    if cmd_start != -1:  # Only add if found
-                        images_in_figure.append(ImageInfo(
-                            full_command=full_command,
-                            path=image_path,
-                            prefix=img_match[0],
-                            suffix=img_match[2],
-                            position_in_doc=cmd_start
-                        ))
+            elif kind == 5:  # \includegraphics[...]{path}
+                if figure_start is None:
+                    continue
+                image_path = match.group(4).strip()
+                if is_image is None or is_image(image_path):
+                    images_in_figure.append(ImageInfo(
+                        full_command=match.group(0),
+                        path=image_path,
+                        prefix=match.group(3),
+                        suffix=match.group(5),
+                        position_in_doc=match.start()
+                    ))
             
-            if images_in_figure:  # Only keep figure environments with images
-                # Sort images by position within figure
-                images_in_figure.sort(key=lambda x: x.position_in_doc)
-                
-                self.figure_environments.append(FigureEnvironment(
-                    position=figure_start,
-                    content=figure_content,
-                    images=images_in_figure
-                ))
-        
-        # Sort figure environments by document position
-        self.figure_environments.sort(key=lambda x: x.position)
+            elif kind == 2:  # \end{figure} / \end{figure*}
+                if figure_start is None:
+                    continue
+                if images_in_figure:  # Only keep figure environments with images
+                    self.figure_environments.append(FigureEnvironment(
+                        position=figure_start,
+                        end=match.end(),
+                        images=images_in_figure
+                    ))
+                figure_start = None
+            
+            elif self._appendix_pos is None:  # \appendix
+                self._appendix_pos = match.start()
         
+        self._figures_scanned = True
         total_images = sum(len(fig.images) for fig in self.figure_environments)
         logger.info(f"Found {len(self.figure_environments)} figure environments with {total_images} images")
         
@@ -180,11 +213,22 @@ class TeXFigureProcessor:
         """
         Find the position of the appendix in the document.
         
+        The position recorded while extract_figure_environments scans the
+        document is reused; before that scan the content is searched directly.
+        
         Returns:
             Position of appendix, or end of document if not found
         """
-        appendix_match = self.appendix_pattern.search(self.tex_content)
-        return appendix_match.start() if appendix_match else len(self.tex_content)
+        if self.tex_content is None:
+            self.load_tex_file()
+        
+        if not self._figures_scanned:
+            appendix_match = self.appendix_pattern.search(self.tex_content)
+            return appendix_match.start() if appendix_match else len(self.tex_content)
+        
+        if self._appendix_pos is None:
+            return len(self.tex_content)
+        return self._appendix_pos
     
     def categorize_figures_by_position(self) -> Tuple[List[FigureEnvironment], List[FigureEnvironment]]:
         """
@@ -216,11 +260,10 @@ class TeXFigureProcessor:
         Returns:
             Tuple of (directory, filename)
         """
-        if '/' in path:
-            parts = path.rsplit('/', 1)
-            if len(parts) == 2:
-                return parts[0] + '/', parts[1]
-        return '', path
+        slash = path.rfind('/')
+        if slash == -1:
+            return '', path
+        return path[:slash + 1], path[slash + 1:]
     
     def generate_new_filename(self, filename: str, expected_prefix: str) -> str:
         """
@@ -261,13 +304,16 @@ class TeXFigureProcessor:
             figure_label=fig_label,
             original_path=orig_path,
             new_path=new_path,
-            needs_rename=needs_rename
+            needs_rename=needs_rename,
+            source_filename=filename,
+            new_filename=new_filename
         ))
         
         if needs_rename:
-            old_full = img_info.full_command
+            self._modified_count += 1
             new_full = img_info.prefix + new_path + img_info.suffix
-            self.modifications[old_full] = new_full
+            start = img_info.position_in_doc
+            self.modifications.append((start, start + len(img_info.full_command), new_full))
     
     def analyze_all_figures(self) -> List[ProcessingResult]:
         """
@@ -279,6 +325,9 @@ class TeXFigureProcessor:
         self.extract_figure_environments()
         main_figures, appendix_figures = self.categorize_figures_by_position()
         
+        self._main_figure_count = len(main_figures)
+        self._appendix_figure_count = len(appendix_figures)
+        
         # Process main text figures
         for fig_idx, fig_env in enumerate(main_figures, 1):
             fig_label = f"Fig {fig_idx}"
@@ -286,6 +335,7 @@ class TeXFigureProcessor:
             
             for img_info in fig_env.images:
                 self.process_single_image(img_info, prefix, fig_label)
+            self._main_images += len(fig_env.images)
         
         # Process appendix figures
         for fig_idx, fig_env in enumerate(appendix_figures, 1):
@@ -294,6 +344,7 @@ class TeXFigureProcessor:
             
             for img_info in fig_env.images:
                 self.process_single_image(img_info, prefix, fig_label)
+            self._appendix_images += len(fig_env.images)
         
         return self.results
     
@@ -303,14 +354,17 @@ class TeXFigureProcessor:
             logger.warning("No results to display")
             return
             
-        print("\n" + "="*100)
-        print("Figure Order | Original Image Name                     | Modified Image Name")
-        print("-" * 100)
-        
-        for result in self.results:
-            print(f"{result.figure_label:12} | {result.original_path:45} | {result.new_path}")
-        
-        print("="*100)
+        # Build the whole table and emit it with a single write
+        lines = [
+            "\n" + "="*100,
+            "Figure Order | Original Image Name                     | Modified Image Name",
+            "-" * 100,
+        ]
+        lines.extend(f"{result.figure_label:12} | {result.original_path:45} | {result.new_path}"
+                     for result in self.results)
+        lines.append("="*100)
+        
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     def print_summary(self) -> None:
         """Print processing summary statistics"""
@@ -318,21 +372,21 @@ class TeXFigureProcessor:
             logger.warning("No results to summarize")
             return
             
-        main_count = len([r for r in self.results if not r.figure_label.startswith('Fig S')])
-        appendix_count = len([r for r in self.results if r.figure_label.startswith('Fig S')])
-        modified_count = len([r for r in self.results if r.needs_rename])
-        
-        main_figures, appendix_figures = self.categorize_figures_by_position()
-        
-        print(f"\n📊 **Processing Summary**")
-        print(f"   • Total figure environments: {len(self.figure_environments)}")
-        print(f"   • Main text figures: {len(main_figures)}")
-        print(f"   • Appendix figures: {len(appendix_figures)}")
-        print(f"   • Total images found: {len(self.results)}")
-        print(f"   • Main text images: {main_count}")
-        print(f"   • Appendix images: {appendix_count}")
-        print(f"   • Images to be renamed: {modified_count}")
-        print(f"   • Images already correct: {len(self.results) - modified_count}")
+        # Counts were tallied by analyze_all_figures
+        modified_count = self._modified_count
+        
+        lines = [
+            f"\n📊 **Processing Summary**",
+            f"   • Total figure environments: {len(self.figure_environments)}",
+            f"   • Main text figures: {self._main_figure_count}",
+            f"   • Appendix figures: {self._appendix_figure_count}",
+            f"   • Total images found: {len(self.results)}",
+            f"   • Main text images: {self._main_images}",
+            f"   • Appendix images: {self._appendix_images}",
+            f"   • Images to be renamed: {modified_count}",
+            f"   • Images already correct: {len(self.results) - modified_count}",
+        ]
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     def save_modified_tex(self, output_filename: Optional[str] = None) -> bool:
         """
@@ -351,20 +405,19 @@ class TeXFigureProcessor:
         if output_filename is None:
             output_filename = self.tex_file.stem + "_reset.tex"
         
-        new_content = self.tex_content
-        
-        # Sort modifications by position (reverse order to avoid position shifts)
-        sorted_modifications = sorted(
-            self.modifications.items(),
-            key=lambda x: self.tex_content.find(x[0]),
-            reverse=True
-        )
-        
-        for old, new in sorted_modifications:
-            if old in new_content:
-                new_content = new_content.replace(old, new, 1)
-            else:
-                logger.warning(f"Could not find command to replace: {old}")
+        # Splice every replacement in at its recorded span in one pass, so
+        # repeated identical commands are each rewritten at their own position
+        content = self.tex_content
+        parts = []
+        cursor = 0
+        for start, end, replacement in sorted(self.modifications):
+            if start < cursor:  # Overlaps an edit already applied
+                continue
+            parts.append(content[cursor:start])
+            parts.append(replacement)
+            cursor = end
+        parts.append(content[cursor:])
+        new_content = ''.join(parts)
         
         try:
             with open(output_filename, 'w', encoding='utf-8') as f:
@@ -395,16 +448,80 @@ class TeXFigureProcessor:
         
         return output_dir
     
-    def copy_and_rename_figures(self, output_dir: str = "figures-reset") -> Dict[str, int]:
+    @staticmethod
+    def _copy_one(source_file: Path, target_file: Path, link_mode: str = "copy",
+                  preserve_metadata: bool = False) -> Tuple[str, str]:
+        """
+        Copy or hard-link a single figure file (runs on a worker thread).
+        
+        Args:
+            source_file: File to copy
+            target_file: Destination path
+            link_mode: "copy", "link", or "auto" (link, falling back to copy)
+            preserve_metadata: Copy with shutil.copy2 instead of shutil.copyfile
+            
+        Returns:
+            Tuple of (status, message) where status is 'copied', 'skipped' or
+            'failed'; for 'copied' the message is "linked" or "copied"
+        """
+        # A missing source is detected by the link/copy itself failing to open
+        # it, rather than by a separate stat up front
+        try:
+            if target_file.exists():
+                return 'skipped', f"Skipped (already exists): {target_file.name}"
+            
+            if link_mode != "copy":
+                try:
+                    os.link(source_file, target_file)
+                    return 'copied', "linked"
+                except FileNotFoundError:
+                    raise  # A copy would fail the same way
+                except FileExistsError:
+                    # Created since the check above; never overwrite it
+                    return 'skipped', f"Skipped (already exists): {target_file.name}"
+                except OSError:
+                    # Cross-device (EXDEV) or no hard-link support
+                    if link_mode == "link":
+                        raise
+            
+            if preserve_metadata:
+                shutil.copy2(source_file, target_file)
+            else:
+                # Data only: copyfile uses the kernel's fast copy paths and
+                # skips the extra copystat syscalls
+                shutil.copyfile(source_file, target_file)
+            return 'copied', "copied"
+            
+        except FileNotFoundError as e:
+            if e.filename is not None and os.fspath(e.filename) == os.fspath(source_file):
+                return 'failed', f"Source not found: {source_file}"
+            return 'failed', f"Failed to copy {source_file}: {str(e)}"
+        except Exception as e:
+            return 'failed', f"Failed to copy {source_file}: {str(e)}"
+    
+    def copy_and_rename_figures(self, output_dir: str = "figures-reset",
+                                link_mode: str = "auto",
+                                preserve_metadata: bool = False) -> Dict[str, int]:
         """
         Copy and rename figure files to the output directory.
         
+        Hard links avoid copying any data when the output directory is on the
+        same filesystem as the figures, but share content with the originals:
+        editing a linked file in place changes both.
+        
         Args:
             output_dir: Output directory name
+            link_mode: "auto" hard-links where possible and copies otherwise,
+                "link" only hard-links, "copy" always copies (previous behaviour)
+            preserve_metadata: Also copy timestamps and permission bits
+                (shutil.copy2) when a file is copied rather than linked
             
         Returns:
             Dictionary with copy statistics
         """
+        if link_mode not in ("auto", "link", "copy"):
+            raise ValueError(f"Invalid link_mode: {link_mode!r}")
+        
         reset_folder = self.create_output_directory(output_dir)
         
         stats = {
@@ -415,37 +532,46 @@ class TeXFigureProcessor:
         
         failed_copies = []
         
+        # Plan all copies first; an image reused by several figures maps to
+        # the same target, which is only copied once
+        tasks = []
+        planned_targets = set()
         for result in self.results:
             source_file = Path(result.original_path)
             
-            if result.needs_rename:
-                # File needs renaming
-                _, new_filename = self.extract_directory_and_filename(result.new_path)
-                target_file = reset_folder / new_filename
-            else:
-                # File doesn't need renaming
-                _, filename = self.extract_directory_and_filename(result.original_path)
-                target_file = reset_folder / filename
+            # Filenames were split off during analysis
+            target_file = reset_folder / (result.new_filename if result.needs_rename
+                                          else result.source_filename)
             
-            try:
-                if not source_file.exists():
-                    failed_copies.append(f"Source not found: {source_file}")
-                    stats['failed'] += 1
-                    continue
-                
-                if target_file.exists():
-                    logger.info(f"Skipped (already exists): {target_file.name}")
-                    stats['skipped'] += 1
-                    continue
-                
-                shutil.copy2(source_file, target_file)
-                action = "Renamed and copied" if result.needs_rename else "Copied"
-                logger.info(f"{action}: {source_file.name} → {target_file.name}")
-                stats['copied'] += 1
+            if target_file in planned_targets:
+                logger.info(f"Skipped (already exists): {target_file.name}")
+                stats['skipped'] += 1
+                continue
+            planned_targets.add(target_file)
+            tasks.append((source_file, target_file, result.needs_rename))
+        
+        # Copies are independent and IO-bound, so run them on a thread pool;
+        # outcomes are reported in document order
+        if tasks:
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(tasks))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    (executor.submit(self._copy_one, source_file, target_file, link_mode, preserve_metadata),
+                     source_file, target_file, needs_rename)
+                    for source_file, target_file, needs_rename in tasks
+                ]
                 
-            except Exception as e:
-                failed_copies.append(f"Failed to copy {source_file}: {str(e)}")
-                stats['failed'] += 1
+                for future, source_file, target_file, needs_rename in futures:
+                    status, message = future.result()
+                    stats[status] += 1
+                    
+                    if status == 'copied':
+                        action = f"Renamed and {message}" if needs_rename else message.capitalize()
+                        logger.info(f"{action}: {source_file.name} → {target_file.name}")
+                    elif status == 'skipped':
+                        logger.info(message)
+                    else:
+                        failed_copies.append(message)
         
         logger.info(f"Copy operation completed: {stats['copied']} copied, {stats['skipped']} skipped, {stats['failed']} failed")
         
@@ -491,6 +617,69 @@ class TeXFigureProcessor:
         except Exception as e:
             logger.error(f"Processing failed: {e}")
             raise
+    
+    @staticmethod
+    def _process_one(job: Tuple[str, str]) -> Tuple[str, Optional[List[ProcessingResult]]]:
+        """
+        Process a single LaTeX file in a worker process.
+        
+        Image paths in a document are relative to its own directory, so the
+        worker runs from there and restores its working directory afterwards.
+        
+        Args:
+            job: Tuple of (absolute LaTeX file path, output directory relative to it)
+            
+        Returns:
+            Tuple of (tex_path, results), with results None if processing failed
+        """
+        tex_path, output_dir = job
+        previous_cwd = os.getcwd()
+        try:
+            os.chdir(os.path.dirname(tex_path))
+            processor = TeXFigureProcessor(os.path.basename(tex_path))
+            return tex_path, processor.execute_full_processing(output_dir=output_dir)
+        except Exception as e:
+            logger.error(f"Failed to process {tex_path}: {e}")
+            return tex_path, None
+        finally:
+            os.chdir(previous_cwd)
+    
+    @classmethod
+    def process_directory(cls, root: str, pattern: str = "**/*.tex",
+                          output_dir: str = "figures-reset",
+                          workers: Optional[int] = None) -> Dict[str, Optional[List[ProcessingResult]]]:
+        """
+        Process every LaTeX file under a directory in parallel.
+        
+        Files are independent, so each one runs the full workflow in its own
+        worker process. Outputs of earlier runs (*_reset.tex) are ignored.
+        
+        Args:
+            root: Directory to search
+            pattern: Glob pattern for LaTeX files, relative to root
+            output_dir: Output directory for figures, relative to each file
+            workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            Dictionary mapping each file path to its results (None on failure)
+        """
+        tex_files = [
+            str(path.resolve()) for path in Path(root).glob(pattern)
+            if path.is_file() and not path.name.endswith("_reset.tex")
+        ]
+        if not tex_files:
+            logger.warning(f"No LaTeX files matching {pattern} under {root}")
+            return {}
+        
+        logger.info(f"Processing {len(tex_files)} LaTeX files")
+        
+        results = {}
+        with multiprocessing.Pool(min(workers or os.cpu_count() or 1, len(tex_files))) as pool:
+            jobs = [(tex_path, output_dir) for tex_path in tex_files]
+            for tex_path, file_results in pool.imap_unordered(cls._process_one, jobs):
+                results[tex_path] = file_results
+        
+        return results
 
 # Example usage and testing
 if __name__ == "__main__":